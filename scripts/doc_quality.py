@@ -21,27 +21,88 @@ of any issues found.
 
 from __future__ import annotations
 
+import functools
+import mmap
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Annotated, Final
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
 
 from scripts.utils.doc_config import DocConfig, custom_theme
+from scripts.utils.doc_files import iter_md_entries
 
 # Constants
 APP_NAME: Final[str] = "Documents Quality"
 APP_VERSION: Final[str] = "0.2.0"
-NUMBER_OF_PARTS_FILE_PATH_NUMBER: Final[int] = 2
+MMAP_MIN_SIZE: Final[int] = 1 << 20  # Files of at least 1 MiB are memory-mapped
+MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
+
+# Documents that are not expected to contain code examples, by file stem
+_SKIP_CODE_EXAMPLE_STEMS: Final[frozenset[str]] = frozenset({"changelog", "license"})
+
+# URL prefixes accepted for link targets and image sources
+_VALID_URL_PREFIX: Final[bytes] = rb"(?:http|#|/|\.\.)"
+
+# One pattern for everything the Markdown checks look for, dispatched on the
+# name of the matching group. The section title is captured in a lookahead so
+# links on a section line are still matched. Only invalid link targets and
+# image sources are captured; valid ones are rejected inside the regex engine.
+_MARKDOWN_RE: Final[re.Pattern[bytes]] = re.compile(
+    rb"(?P<header>^# [^\r\n])"
+    rb"|(?P<section>^## (?=(?P<title>[^\r\n]*)))"
+    rb"|(?P<image>!\[[^\]]*\]\((?:(?=" + _VALID_URL_PREFIX + rb")[^)]*|(?P<src>[^)]*))\))"
+    rb"|(?P<link>\[[^\]]+\]\((?!" + _VALID_URL_PREFIX + rb")(?P<url>[^)]+)\))",
+    re.MULTILINE,
+)
 
 # Rich console setup
 console = Console(theme=custom_theme)
 app = typer.Typer()
 
 
+@dataclass
+class ContentScan:
+    """Facts collected from a single pass over the raw bytes of a Markdown file."""
+
+    has_header: bool = False
+    has_image: bool = False
+    missing_sections: set[bytes] = field(default_factory=set)
+    invalid_links: list[bytes] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=4096)
+def _lang_from_name(file_name: str, supported_languages: frozenset[str]) -> str:
+    """
+    Extract language code from file name (suffix method).
+
+    The result is cached, so the translation check reuses the codes found
+    while checking the files.
+
+    Args:
+    ----
+        file_name (str): Name of the file.
+        supported_languages (frozenset[str]): The supported language codes.
+
+    Returns:
+    -------
+        str: The language code, or an empty string if not found.
+
+    """
+    # "name.lang.md": drop the extension, then take the part after the last dot
+    stem = file_name.rpartition(".")[0]
+    _, dot, lang = stem.rpartition(".")
+    if dot and lang in supported_languages:
+        return lang
+    return ""
+
+
 class DocChecker:
     """
     Documentation Quality Checker.
@@ -62,11 +123,31 @@ class DocChecker:
         """
         self.config = config
         self.console = console  # Use the global console object
-        self.issues: dict[str, list[str]] = {}
+        # (file or check, [(style, message), ...]) entries in the order they were found
+        self._issue_entries: list[tuple[str, list[tuple[str, str]]]] = []
+        # The checks run on raw bytes, so compare against encoded section names
+        self._required_sections_b: frozenset[bytes] = frozenset(s.encode() for s in config.required_sections)
+        # Console lines of the checks, written in one go by generate_report
+        self._pending_lines: list[Text] = []
+
+    @property
+    def issues(self) -> dict[str, list[tuple[str, str]]]:
+        """
+        Return the issues found so far, keyed by file or check.
+
+        Returns
+        -------
+            dict[str, list[tuple[str, str]]]: The (style, message) issues found so far.
 
-    def _read_file(self, file_path: Path) -> str | None:
         """
-        Read file content with error handling.
+        return dict(self._issue_entries)
+
+    def _read_file(self, file_path: Path) -> bytes:
+        """
+        Read the raw content of a file.
+
+        All markers the checks look for are ASCII, so the content is not
+        decoded; only the fragments quoted in issue messages are.
 
         Args:
         ----
@@ -74,165 +155,214 @@ class DocChecker:
 
         Returns:
         -------
-            Optional[str]: The file content, or None if an error occurred.
+            bytes: The file content.
+
+        Raises:
+        ------
+            OSError: If the file cannot be read.
 
         """
-        try:
-            with file_path.open(encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            self.console.print(f"[error]File not found: {file_path}[/error]")
-            self.issues[str(file_path)] = ["File not found"]
-            return None
-        except (OSError, PermissionError) as e:
-            self.console.print(
-                f"[error]Error reading file: {file_path} - {e}[/error]",
-            )
-            self.issues[str(file_path)] = [f"Error reading file: {e}"]
-            return None
+        return file_path.read_bytes()
 
-    def _perform_checks(self, file_path: Path, content: str) -> list[str]:
+    def _scan_content(self, content: bytes | mmap.mmap) -> ContentScan:
+        """
+        Scan the Markdown content in a single pass.
+
+        A single combined pattern finds headers, sections, images and
+        invalid links; each match is dispatched on its group name. Image
+        sources are validated like link targets.
+
+        Args:
+        ----
+            content (bytes | mmap.mmap): The content of the Markdown file.
+
+        Returns:
+        -------
+            ContentScan: The facts collected from the content.
+
+        """
+        scan = ContentScan(missing_sections=set(self._required_sections_b))
+
+        for match in _MARKDOWN_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == "header":
+                scan.has_header = True
+            elif kind == "section":
+                # Only required sections matter; stop looking once all were seen
+                if scan.missing_sections:
+                    scan.missing_sections.discard(match["title"].strip())
+            elif kind == "image":
+                scan.has_image = True
+                if match["src"]:
+                    scan.invalid_links.append(match["src"])
+            else:
+                scan.invalid_links.append(match["url"])
+
+        return scan
+
+    def _perform_checks(self, file_name: str, content: bytes | mmap.mmap) -> list[tuple[str, str]]:
         """
         Perform various quality checks on the Markdown content.
 
         Args:
         ----
-            file_path (Path): Path to the Markdown file.
-            content (str): The content of the Markdown file.
+            file_name (str): Name of the Markdown file.
+            content (bytes | mmap.mmap): The content of the Markdown file.
 
         Returns:
         -------
-            list[str]: A list of issues found during the checks.
+            list[tuple[str, str]]: The (style, message) issues found during the checks.
 
         """
-        file_issues: list[str] = []
+        file_issues: list[tuple[str, str]] = []
+
+        scan = self._scan_content(content)
 
         # Basic checks
-        if len(content) < self.config.min_length:
-            file_issues.append(
-                f"[warning]Content too short ({len(content)} chars)[/warning]",
-            )
+        # The minimum length counts characters; only non-ASCII content needs decoding for that
+        length = len(content) if content.isascii() else len(content.decode("utf-8", errors="replace"))
+        if length < self.config.min_length:
+            file_issues.append(("warning", f"Content too short ({length} chars)"))
 
-        if not re.search(r"^#\s.+", content, re.MULTILINE):
-            file_issues.append("[error]Missing main header[/error]")
+        if not scan.has_header:
+            file_issues.append(("error", "Missing main header"))
 
         # Code examples
         if (
             self.config.code_example_required
-            and file_path.stem not in {"changelog", "license"}
-            and not re.search(r"```.*\n", content)
+            and file_name.rpartition(".")[0] not in _SKIP_CODE_EXAMPLE_STEMS
+            and content.find(b"```") < 0  # mmap has no substring `in`
         ):
-            file_issues.append("[warning]No code examples found[/warning]")
+            file_issues.append(("warning", "No code examples found"))
 
         # Section checks
-        if self.config.required_sections:
-            sections: set[str] = set(
-                re.findall(r"^##\s+(.+)$", content, re.MULTILINE),
-            )
-            missing: set[str] = self.config.required_sections - sections
-            if missing:
-                file_issues.append(
-                    f"[error]Missing required sections: {', '.join(missing)}[/error]",
-                )
+        if scan.missing_sections:
+            missing: list[str] = [s.decode() for s in scan.missing_sections]
+            file_issues.append(("error", f"Missing required sections: {', '.join(missing)}"))
 
         # Image checks
-        if self.config.image_required and not re.search(r"!$$.*$$$.*$", content):
-            file_issues.append("[warning]No images found[/warning]")
+        if self.config.image_required and not scan.has_image:
+            file_issues.append(("warning", "No images found"))
 
         # Links check
-        links: list[tuple[str, str]] = re.findall(r"$$([^$$]+)\]$([^$]+)\)", content)
-        for _, url in links:
-            if not url.startswith(("http", "#", "/", "..")):
-                file_issues.append(f"[error]Invalid link: {url}[/error]")
+        file_issues.extend(("error", f"Invalid link: {url.decode(errors='replace')}") for url in scan.invalid_links)
 
         # Language-specific checks
-        lang_code = self._get_language_code(file_path)
+        lang_code = _lang_from_name(file_name, self.config.supported_languages)
         if lang_code and lang_code not in self.config.supported_languages:
-            file_issues.append(f"[error]Unsupported language: {lang_code}[/error]")
+            file_issues.append(("error", f"Unsupported language: {lang_code}"))
 
         return file_issues
 
-    def _get_language_code(self, file_path: Path) -> str | None:
-        """
-        Extract language code from file path (suffix method).
-
-        Args:
-        ----
-            file_path (Path): Path to the file.
-
-        Returns:
-        -------
-            Optional[str]: The language code, or None if not found.
-
-        """
-        file_name = file_path.name
-        parts = file_name.split(".")  # Split by dots
-        if len(parts) > NUMBER_OF_PARTS_FILE_PATH_NUMBER:  # Check if there's a language suffix
-            lang = parts[-2]  # Language code is the second to last part
-            # Check if there's a language suffix AND if language in supported languages
-            if len(parts) > NUMBER_OF_PARTS_FILE_PATH_NUMBER and lang in self.config.supported_languages:
-                return lang
-        return None
-
-    def check_translations(self, docs_dir: Path) -> None:
+    def check_translations(self, md_files: list[Path]) -> None:
         """
         Check if all documents are translated (suffix method).
 
         Args:
         ----
-            docs_dir (Path): Path to the documentation directory.
+            md_files (list[Path]): The Markdown files of the documentation directory.
 
         """
+        if not self.config.supported_languages or not md_files:
+            return
+
         base_docs: set[str] = set()
-        translated_docs: dict[str, set[str]] = {lang: set() for lang in self.config.supported_languages}
+        translated_docs: defaultdict[str, set[str]] = defaultdict(set)
 
         # Collect all documents
-        for file in docs_dir.rglob("*.md"):
-            lang = self._get_language_code(file)
-            file_stem = file.name
+        for file in md_files:
+            name = file.name
+            lang = _lang_from_name(name, self.config.supported_languages)
+            file_stem = name
             if lang:
                 # It is a translation
-                # It is a translation
-                file_stem = ".".join(file.name.split(".")[:-2]) + ".md"
+                file_stem = name.rsplit(".", 2)[0] + ".md"
                 translated_docs[lang].add(file_stem)
             else:
                 # It is a default language
-                # It is a default language
-                base_docs.add(file.name)
+                base_docs.add(name)
+
+        if not base_docs:
+            return
 
         # Check missing translations
-        for lang, docs in translated_docs.items():
-            missing = base_docs - docs
+        for lang in self.config.supported_languages:
+            # Languages without any translation miss every base document
+            docs = translated_docs.get(lang)
+            missing = base_docs.difference(docs) if docs else base_docs
             if missing:
-                self.issues[f"Missing {lang} translations"] = list(missing)
-                self.console.print(f"[warning]Missing {lang} translations:[/warning]")
-                for doc in missing:
-                    self.console.print(f"  - {doc}")
+                self._issue_entries.append((f"Missing {lang} translations", [("", doc) for doc in missing]))
+                self._pending_lines.append(Text(f"Missing {lang} translations:", style="warning"))
+                self._pending_lines.extend(Text(f"  - {doc}") for doc in missing)
 
-    def check_markdown(self, file_path: Path) -> None:
+    def check_markdown(self, file_path: Path) -> list[tuple[str, str]]:
         """
         Check a Markdown file for quality issues.
 
+        This method does not touch the shared state of the checker, so it
+        can run concurrently for several files.
+
         Args:
         ----
             file_path (Path): Path to the Markdown file.
 
+        Returns:
+        -------
+            list[tuple[str, str]]: The (style, message) issues found in the file.
+
         """
-        content = self._read_file(file_path)
-        if content is None:
-            return
+        try:
+            size = file_path.stat().st_size
+            if size >= MMAP_MIN_SIZE:
+                # Scan large files straight from the page cache instead of copying them
+                with file_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._perform_checks(file_path.name, mapped)
+            # Empty files fail the length check anyway; don't open them at all
+            content = self._read_file(file_path) if size else b""
+        except FileNotFoundError:
+            return [("error", "File not found")]
+        except OSError as e:
+            return [("error", f"Error reading file: {e}")]
 
-        file_issues = self._perform_checks(file_path, content)
+        return self._perform_checks(file_path.name, content)
+
+    def check_markdown_files(self, md_files: list[Path]) -> None:
+        """
+        Check Markdown files in parallel and record their issues.
 
-        if file_issues:
-            self.issues[str(file_path)] = file_issues
-            self.console.print(f"[file]{file_path}[/file]:")
-            for issue in file_issues:
-                self.console.print(f"  - {issue}")
+        The files are checked on a thread pool; the issues are recorded and
+        queued for output afterwards in the order of `md_files`.
+
+        Args:
+        ----
+            md_files (list[Path]): The Markdown files to check.
+
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(self.check_markdown, md_files))
+
+        for file_path, file_issues in zip(md_files, results, strict=True):
+            if file_issues:
+                self._issue_entries.append((str(file_path), file_issues))
+                self._pending_lines.append(Text.assemble((str(file_path), "file"), ":"))
+                self._pending_lines.extend(Text.assemble("  - ", (message, style)) for style, message in file_issues)
 
     def generate_report(self) -> None:
-        """Generate a formatted report of issues."""
-        if self.issues:
+        """
+        Print the buffered check output and a formatted report of issues.
+
+        The issues are kept as (style, message) pairs and styled here with
+        `Text`, so no markup has to be parsed for them.
+        """
+        # The renderables are only needed here; keep them off the import path
+        from rich.panel import Panel  # noqa: PLC0415
+        from rich.table import Table  # noqa: PLC0415
+
+        if self._pending_lines:
+            self.console.print(Text("\n").join(self._pending_lines))
+            self._pending_lines.clear()
+
+        if self._issue_entries:
             table = Table(
                 title="[error]Documentation Quality Report[/error]",
                 show_lines=True,
@@ -240,8 +370,8 @@ class DocChecker:
             table.add_column("[file]File[/file]", style="file")
             table.add_column("[error]Issues[/error]", style="error", overflow="fold")
 
-            for file, file_issues in self.issues.items():
-                table.add_row(file, "\n".join(file_issues))
+            for file, file_issues in self._issue_entries:
+                table.add_row(Text(file), Text("\n").join(Text(message, style=style) for style, message in file_issues))
 
             self.console.print(table)
         else:
@@ -251,12 +381,6 @@ class DocChecker:
                     border_style="success",
                 ),
             )
-            self.console.print(
-                Panel(
-                    "[success]Documentation quality check passed![/success]",
-                    border_style="success",
-                ),
-            )
 
 
 def version_callback(*, value: bool) -> None:
@@ -281,23 +405,28 @@ def doc_quality(
     _version: Annotated[bool | None, typer.Option("--version", callback=version_callback)] = None,
 ) -> None:
     """Run documentation quality checks."""
+    if not Path(docs_dir).is_dir():
+        console.print(f"[error]Documentation directory not found: {docs_dir}[/error]")
+        raise typer.Exit(1)
+
     config = DocConfig()  # Create a DocConfig object to access config_path
 
     # Load configuration or create default
-    if not config.config_path.exists():
-        config = config.create_default_config(config.config_path)
-    else:
+    try:
         config = DocConfig.from_toml(config.config_path)
+    except FileNotFoundError:
+        config = config.create_default_config(config.config_path)
 
     checker = DocChecker(config)
 
-    docs_path = Path(docs_dir)
+    # Walk the documentation tree once and share the result between the checks
+    md_files = [Path(entry.path) for entry in iter_md_entries(docs_dir)]
+
     # Check all markdown files
-    for md_file in docs_path.rglob("*.md"):
-        checker.check_markdown(md_file)
+    checker.check_markdown_files(md_files)
 
     # Check translations
-    checker.check_translations(docs_path)
+    checker.check_translations(md_files)
 
     # Generate report
     checker.generate_report()
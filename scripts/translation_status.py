@@ -14,20 +14,17 @@ suffix and translated documents have the "name.lang.md" naming scheme
 
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Annotated, Final
 
 import typer
 from rich.console import Console
 
 from scripts.utils.doc_config import DocConfig, custom_theme
+from scripts.utils.doc_files import iter_md_entries
 
 APP_NAME: Final[str] = "Translation Status"
 APP_VERSION: Final[str] = "0.2.0"
-PARTS_COUNT: Final[int] = 3  # Number of parts for a file path name.lang.md
-NUMBER_OF_PARTS_FILE_PATH_NUMBER: Final[int] = 2
 
 console = Console(theme=custom_theme)
 app = typer.Typer()
@@ -58,30 +55,36 @@ class TranslationCoverageCalculator:
         self.docs_dir = docs_dir
         self.console = console  # Use the global console object
         self.verbose = verbose
+        self._output_buf: list[str] = []
+
+    def _flush_output(self) -> None:
+        """Print the buffered output lines at once and clear the buffer."""
+        if self._output_buf:
+            self.console.print("\n".join(self._output_buf))
+            self._output_buf.clear()
 
     def _process_english_doc(self, file: str, english_docs: set[str]) -> None:
         """Verarbeitet eine englische Dokumentdatei."""
         english_docs.add(file)
         if self.verbose:
-            self.console.print(f"[verbose]  Detected English doc: {file}[/verbose]")
-
-    def _process_translated_doc(self, file: str, translated_docs: dict[str, set[str]]) -> None:
+            self._output_buf.append(f"[verbose]  Detected English doc: {file}[/verbose]")
+
+    def _process_translated_doc(
+        self,
+        file: str,
+        base_name: str,
+        lang: str,
+        translated_docs: dict[str, set[str]],
+    ) -> None:
         """Verarbeitet eine übersetzte Dokumentdatei."""
-        try:
-            parts = file.split(".")
-            lang = parts[-2]
-            base_name = ".".join([*parts[:-2], parts[-1]])  # name.md
-
-            translated_docs.setdefault(lang, set()).add(base_name)
+        translated_docs.setdefault(lang, set()).add(base_name)
 
-            if self.verbose:
-                self.console.print(f"[verbose]  Detected translated doc ({lang}): {file} (Base: {base_name})[/verbose]")
-        except IndexError:  # Wenn `parts[-2]` oder `parts[-1]` nicht existiert
-            self.console.print(f"[warning]Could not parse language or base name for {file}. Skipping.[/warning]")
-        except (OSError, PermissionError) as e:
-            self.console.print(f"[warning]Could not determine language for {file}: {e}[/warning]")
+        if self.verbose:
+            self._output_buf.append(
+                f"[verbose]  Detected translated doc ({lang}): {file} (Base: {base_name})[/verbose]"
+            )
 
-    def collect_document_statuses(self) -> tuple[set[str], dict[str, set[str]]]:
+    def collect_translation_stats(self) -> TranslationStats:
         """
         Collect translation statistics from the documentation directory.
 
@@ -94,27 +97,25 @@ class TranslationCoverageCalculator:
         english_docs: set[str] = set()
         translated_docs: dict[str, set[str]] = {}
 
-        for root, _, files in os.walk(self.docs_dir):
-            for file in files:
-                filepath = Path(root) / file  # filePath immer definieren
+        for entry in iter_md_entries(self.docs_dir):
+            file = entry.name
 
-                # Frühe Rückgabe / Continue für nicht-Markdown-Dateien
-                if not file.endswith(".md"):
-                    continue
-
-                if self.verbose:
-                    self.console.print(f"[verbose]Processing: {filepath}[/verbose]")
+            if self.verbose:
+                self._output_buf.append(f"[verbose]Processing: {entry.path}[/verbose]")
 
-                parts = file.split(".")
+            # "name.md" or "name.lang.md": drop the extension, then split off the language
+            stem = file.rpartition(".")[0]
+            base, dot, lang = stem.rpartition(".")
 
-                if len(parts) == NUMBER_OF_PARTS_FILE_PATH_NUMBER:
-                    self._process_english_doc(file, english_docs)
-                elif len(parts) == PARTS_COUNT:
-                    self._process_translated_doc(file, translated_docs)
-                # Optional: Handle andere Dateinamenskonventionen hier mit einem 'else'
-                # oder lass sie einfach ignorieren.
+            if not dot:
+                self._process_english_doc(file, english_docs)
+            elif "." not in base:
+                self._process_translated_doc(file, base + ".md", lang, translated_docs)
+            # Optional: Handle andere Dateinamenskonventionen hier mit einem 'else'
+            # oder lass sie einfach ignorieren.
 
-        return english_docs, translated_docs
+        self._flush_output()
+        return TranslationStats(english_docs, translated_docs)
 
     def calculate_coverage(self) -> float:
         """
@@ -134,20 +135,18 @@ class TranslationCoverageCalculator:
 
         for lang, translated_bases in translated_docs.items():
             # Find the intersection of translated bases and existing english doc
-            intersection = english_docs.intersection(translated_bases)
+            intersection = translated_bases & english_docs
             translated_count += len(intersection)
 
             if self.verbose:
-                console.print(
-                    f"[verbose]  Language {lang}: {len(intersection)} translated[/verbose]",
-                )
-                console.print(f"[verbose]  Intersection doc: {intersection} ")
+                self._output_buf.append(f"[verbose]  Language {lang}: {len(intersection)} translated[/verbose]")
+                self._output_buf.append(f"[verbose]  Intersection doc: {intersection}[/verbose]")
+
+        self._flush_output()
 
-        return (
-            (translated_count / (len(translated_docs) * total_docs)) * 100
-            if len(translated_docs) > 0 and total_docs > 0
-            else 0
-        )
+        # One slot per document and language that has any translation
+        slots = len(translated_docs) * total_docs
+        return translated_count * 100 / slots if slots else 0.0
 
 
 def version_callback(*, value: bool) -> None:
@@ -181,10 +180,10 @@ def translation_status(
     _version: Annotated[bool | None, typer.Option("--version", callback=version_callback)] = None,
 ) -> None:
     config = DocConfig()
-    if not config.config_path.exists():
-        config = config.create_default_config(config.config_path)
-    else:
+    try:
         config = DocConfig.from_toml(config.config_path)
+    except FileNotFoundError:
+        config = config.create_default_config(config.config_path)
 
     calculator = TranslationCoverageCalculator(config, docs_dir, verbose)
     coverage = calculator.calculate_coverage()
@@ -10,7 +10,6 @@ import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import tomli_w
 from rich.console import Console
 from rich.style import Style
 from rich.theme import Theme
@@ -36,8 +35,8 @@ class DocConfig:
     Attributes
     ----------
         min_length (int): Minimum content length in characters.
-        required_sections (set[str]): Set of required section headers.
-        supported_languages (set[str]): Set of supported language codes.
+        required_sections (frozenset[str]): Set of required section headers.
+        supported_languages (frozenset[str]): Set of supported language codes.
         code_example_required (bool): Whether code examples are required.
         image_required (bool): Whether images are required.
         config_path (Path): Path to the TOML configuration file.
@@ -45,12 +44,17 @@ class DocConfig:
     """
 
     min_length: int = 100
-    required_sections: set[str] = field(default_factory=set)
-    supported_languages: set[str] = field(default_factory=set)
+    required_sections: frozenset[str] = field(default_factory=frozenset)
+    supported_languages: frozenset[str] = field(default_factory=frozenset)
     code_example_required: bool = True
     image_required: bool = False
     config_path: Path = Path("scripts") / "doc_quality.toml"  # Change to .toml
 
+    def __post_init__(self) -> None:
+        """Freeze the sections and languages, which are only ever read by the checks."""
+        self.required_sections = frozenset(self.required_sections)
+        self.supported_languages = frozenset(self.supported_languages)
+
     @classmethod
     def from_toml(cls, path: Path) -> DocConfig:
         """
@@ -64,21 +68,22 @@ class DocConfig:
         -------
             DocConfig: A DocConfig instance with values from the TOML file.
 
+        Raises:
+        ------
+            FileNotFoundError: If the configuration file does not exist.
+
         """
         try:
             with path.open("rb") as f:  # Open the file in binary mode
                 config_data = tomllib.load(f)  # Load the TOML file
-        except FileNotFoundError:
-            console.print(f"[error]Config file not found: {path}[/error]")
-            sys.exit(1)
         except tomllib.TOMLDecodeError as e:
             console.print(f"[error]Error parsing config file: {path} - {e}[/error]")
             sys.exit(1)
 
         # Extract values from the loaded data, providing defaults
         min_length = config_data.get("min_length", 100)
-        required_sections = set(config_data.get("required_sections", []))
-        supported_languages = set(config_data.get("supported_languages", []))
+        required_sections = frozenset(config_data.get("required_sections", []))
+        supported_languages = frozenset(config_data.get("supported_languages", []))
         code_example_required = config_data.get("code_example_required", True)
         image_required = config_data.get("image_required", False)
 
@@ -107,17 +112,20 @@ class DocConfig:
         """
         config = cls(
             min_length=100,
-            required_sections={"Installation", "Usage", "Configuration"},
-            supported_languages={"en", "de", "it", "es"},
+            required_sections=frozenset({"Installation", "Usage", "Configuration"}),
+            supported_languages=frozenset({"en", "de", "it", "es"}),
             code_example_required=True,
             image_required=True,
         )
 
+        # Only needed when writing a new config file
+        import tomli_w  # noqa: PLC0415
+
         # Ensure the parent directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with config_path.open("w", encoding="utf-8") as f:
+            with config_path.open("wb") as f:  # tomli_w writes bytes
                 tomli_w.dump(
                     {
                         "min_length": config.min_length,
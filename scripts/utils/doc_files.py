@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: EUPL-1.2
+#
+# SPDX-FileCopyrightText: © 2025-present Jürgen Mülbert
+#
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def iter_md_entries(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """
+    Walk a directory tree with `os.scandir` and yield all Markdown files.
+
+    The entries carry the file name and path as strings, so no `Path`
+    object is built per file. Files of a directory are yielded before
+    descending into its subdirectories; symbolic links to directories are
+    not followed. Like `os.walk`, directories that are missing or cannot
+    be listed are skipped.
+
+    Args:
+    ----
+        root (str | os.PathLike[str]): The directory to walk.
+
+    Yields:
+    ------
+        os.DirEntry[str]: The directory entry of each Markdown file found.
+
+    """
+    subdirs: list[str] = []
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".md"):
+                yield entry
+
+    for subdir in subdirs:
+        yield from iter_md_entries(subdir)
@@ -1,12 +1,29 @@
 # __main__.py
 from __future__ import annotations
 
-from checkconnect.cli.main import main_app
+import sys
 
 
 def main() -> None:
-    pass
+    """
+    Run the CheckConnect command line interface.
 
+    A bare `--version`/`-V` is answered before the CLI, its sub-commands and
+    the logging setup are imported; everything else is dispatched to Typer.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from rich.console import Console  # noqa: PLC0415
+
+        from checkconnect.__about__ import __app_name__, __version__  # noqa: PLC0415
+
+        # Same output as the `--version` option of the Typer app
+        Console().print(f"[bold blue]{__app_name__}[/] version: [bold green]{__version__}[/]")
+        return
+
+    from checkconnect.cli.main import main_app  # noqa: PLC0415
 
-if __name__ == "__main__":
     main_app()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,6 @@ import typer
 from rich.console import Console
 
 from checkconnect.exceptions import ExitExceptionError
-from checkconnect.gui import startup
 
 if TYPE_CHECKING:
     from checkconnect.config.appcontext import AppContext
@@ -64,6 +63,9 @@ def gui(ctx: typer.Context) -> None:
     log.debug(app_context.gettext("Debug logging is active based on verbosity setting."))
 
     try:
+        # Qt is only loaded once the GUI is actually started, not for every CLI command
+        from checkconnect.gui import startup  # noqa: PLC0415
+
         # Pass the app_context to your GUI startup function.
         # This function should then use app_context.settings, app_context.gettext,
         # and app_context.get_module_logger to build and run the GUI.
@@ -12,43 +12,132 @@ before handing control to specific subcommands or the GUI.
 
 from __future__ import annotations
 
+import importlib
 import logging
-import sys
 from pathlib import Path  # noqa: TC003
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, Final
 
-import structlog
+import click
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
 
 from checkconnect import __about__
-from checkconnect.cli.gui_app import gui_app
-
-# from checkconnect.cli.summary_app import summary_app
 from checkconnect.cli.options import (
     get_config_option_definition,
     get_language_option_definition,
     get_verbose_option_definition,
 )
-from checkconnect.cli.report_app import report_app
+from checkconnect.exceptions import ExitExceptionError, LogHandlerError  # Import for specific error handling
 
-# Import sub-commands
-from checkconnect.cli.run_app import run_app
-from checkconnect.cli.summary_app import summary_app
-from checkconnect.config.appcontext import AppContext
+# structlog and the config managers are imported where they are used, so that
+# `--help` and shell completion do not have to load them.
+if TYPE_CHECKING:
+    import structlog
+
+    from checkconnect.config.appcontext import AppContext
+    from checkconnect.config.logging_manager import LoggingManager
+    from checkconnect.config.settings_manager import SettingsManager
+    from checkconnect.config.translation_manager import TranslationManager
+
+_SUBCOMMAND_HELP_KEY: Final[str] = "checkconnect.subcommand_help"
+_COMMAND_LISTING_KEY: Final[str] = "checkconnect.command_listing"
+
+# Sub-commands by name, as "module:attribute" of their Typer app. They are only
+# imported once Click resolves the command, so a run never loads the others.
+_SUBCOMMANDS: Final[dict[str, str]] = {
+    "run": "checkconnect.cli.run_app:run_app",
+    "report": "checkconnect.cli.report_app:report_app",
+    "summary": "checkconnect.cli.summary_app:summary_app",
+    "gui": "checkconnect.cli.gui_app:gui_app",
+}
+
+# One-line descriptions for the command list of the root `--help`, so that listing the
+# sub-commands does not import them. Each is the first line of the command's docstring.
+_SUBCOMMAND_SUMMARIES: Final[dict[str, str]] = {
+    "run": "Run network tests for NTP and HTTPS servers.",
+    "report": "Generate HTML and PDF reports from the most recent connectivity test results.",
+    "summary": "Generate a summary of the most recent connectivity test results.",
+    "gui": "Run CheckConnect in graphical user interface (GUI) mode.",
+}
+
+# Sub-commands that run in CLI mode, i.e. with console logging enabled
+_CLI_SUBCOMMANDS: Final[frozenset[str]] = frozenset({"run", "report", "summary"})
+
+
+def _requests_help(ctx: click.Context, cmd_name: str, cmd: click.Command, args: list[str]) -> bool:
+    """
+    Tell whether the arguments of a sub-command ask for its help.
 
-# Import your bootstrap logging function (ensure this file exists)
-from checkconnect.config.logging_bootstrap import bootstrap_logging
+    The arguments are parsed with the sub-command's own parser, so a help flag that is
+    an option value (`--reports-dir --help`) or follows `--` does not count.
+
+    Args:
+    ----
+        ctx (click.Context): The context of the root command group.
+        cmd_name (str): The name the sub-command was invoked with.
+        cmd (click.Command): The resolved sub-command.
+        args (list[str]): The arguments following the sub-command name.
+
+    Returns:
+    -------
+        bool: True if the sub-command will only print its help.
+    """
+    sub_ctx = cmd.context_class(cmd, info_name=cmd_name, parent=ctx, resilient_parsing=True)
+    try:
+        opts, _, _ = cmd.make_parser(sub_ctx).parse_args(args=list(args))
+    except click.UsageError:
+        # Malformed arguments are reported when the sub-command itself parses them.
+        return False
+    return bool(opts.get("help"))
+
+
+class _MainGroup(TyperGroup):
+    """Root command group that loads its sub-commands lazily."""
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*super().list_commands(ctx), *_SUBCOMMANDS]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> click.Command | None:
+        target = _SUBCOMMANDS.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+
+        if ctx is not None and ctx.meta.get(_COMMAND_LISTING_KEY):
+            # The root help only shows names and one-line descriptions.
+            return click.Command(cmd_name, help=_SUBCOMMAND_SUMMARIES[cmd_name])
+
+        module_name, _, app_name = target.partition(":")
+        sub_app: typer.Typer = getattr(importlib.import_module(module_name), app_name)
+        # Build the command as a member of the root app, the way `add_typer` would,
+        # so it shares its markup mode and gets no completion options of its own.
+        return typer.main.get_command_from_info(
+            sub_app.registered_commands[0],
+            pretty_exceptions_short=main_app.pretty_exceptions_short,
+            rich_markup_mode=main_app.rich_markup_mode,
+        )
+
+    def format_help(self, ctx: typer.Context, formatter: click.HelpFormatter) -> None:
+        ctx.meta[_COMMAND_LISTING_KEY] = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            del ctx.meta[_COMMAND_LISTING_KEY]
+
+    def resolve_command(
+        self, ctx: typer.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, rest = super().resolve_command(ctx, args)
+        # Click resolves the sub-command right before it runs the main callback,
+        # but parses the sub-command's own arguments only afterwards.
+        ctx.meta[_SUBCOMMAND_HELP_KEY] = cmd is not None and _requests_help(ctx, cmd_name or "", cmd, rest)
+        return cmd_name, cmd, rest
 
-# Import your singleton managers
-from checkconnect.config.logging_manager import VERBOSITY_LEVELS, LoggingManager, LoggingManagerSingleton
-from checkconnect.config.settings_manager import SettingsManager, SettingsManagerSingleton
-from checkconnect.config.translation_manager import TranslationManager, TranslationManagerSingleton
-from checkconnect.exceptions import ExitExceptionError, LogHandlerError  # Import for specific error handling
 
 # Initialize Typer CLI app and Rich console
 main_app = typer.Typer(
     name="cli",
+    cls=_MainGroup,
     help="Check network connectivity and generate reports - CLI or GUI",
     rich_markup_mode="rich",
     pretty_exceptions_show_locals=False,
@@ -61,34 +150,9 @@ and dispatching to various subcommands (run, report, summary) or the GUI.
 It is configured to use rich markup for enhanced terminal output.
 """
 
-main_app.add_typer(
-    run_app,
-    help=f"Run {__about__.__app_name__} in CLI mode (run tests).",
-)
-
-main_app.add_typer(
-    report_app,
-    help=f"Run {__about__.__app_name__} in CLI mode (generate reports).",
-)
-
-main_app.add_typer(
-    summary_app,
-    help=f"Run {__about__.__app_name__} in CLI mode (show summary).",
-)
-
-main_app.add_typer(
-    gui_app,
-    help=f"Run {__about__.__app_name__} in GUI mode.",
-)
-
 console = Console()
 """A Rich Console instance for direct terminal output."""
 
-# --- Phase 1: Bootstrap Logging (GLOBAL, runs immediately on import) ---
-# This is crucial. It ensures structlog is minimally configured BEFORE
-# any other application code or Typer callbacks try to get a logger.
-bootstrap_logging()
-
 
 # --- Global Logger for main.py ---
 # This logger will initially use the bootstrap configuration, and then
@@ -101,6 +165,8 @@ def main_logger() -> structlog.BoundLogger:
     This logger is used for critical initialization messages before the full
     logging configuration is applied.
     """
+    import structlog  # noqa: PLC0415
+
     return structlog.get_logger("main")
 
 
@@ -112,12 +178,16 @@ def _version_callback(*, value: bool = False) -> None:
     ----
         value (bool): Whether to display the version. This option is eagerly
                       evaluated by Typer.
+
+    Raises:
+    ------
+        typer.Exit: After the version has been printed, to end the application with status code 0.
     """
     if value:
         console.print(
             f"[bold blue]{__about__.__app_name__}[/] version: [bold green]{__about__.__version__}[/]",
         )
-        sys.exit()
+        raise typer.Exit
 
 
 # --- Helper Functions for Initialization ---
@@ -143,21 +213,23 @@ def _initialize_settings_manager(config_file: Path | None) -> SettingsManager:
         typer.Exit: If a critical error occurs during settings initialization,
                     the application exits with status code 1.
     """
-    main_logger().debug("Main callback: Initializing SettingsManager...")
+    from checkconnect.config.settings_manager import SettingsManagerSingleton  # noqa: PLC0415
+
+    # Logging is not reconfigured while this runs, so one logger serves the whole function.
+    log = main_logger()
+    log.debug("Main callback: Initializing SettingsManager...")
     try:
         settings_manager = SettingsManagerSingleton.get_instance()
         SettingsManagerSingleton.initialize_from_context(config_path=config_file)
 
     except Exception as e:
-        main_logger().exception(
-            "Main callback: Failed to initialize SettingsManager or load configuration!", exc_info=e
-        )
+        log.exception("Main callback: Failed to initialize SettingsManager or load configuration!", exc_info=e)
         console.print(f"[bold red]Critical Error:[/bold red] Failed to load application configuration: {e}")
         raise typer.Exit(1) from e
     else:
-        main_logger().info("Main callback: SettingsManager initialized and configuration loaded.")
+        log.info("Main callback: SettingsManager initialized and configuration loaded.")
         for err in SettingsManagerSingleton.get_initialization_errors():
-            main_logger().warning("Main callback: SettingsManager setup warning:", error_details=str(err))
+            log.warning("Main callback: SettingsManager setup warning:", error_details=str(err))
         return settings_manager
 
 
@@ -185,7 +257,10 @@ def _initialize_translation_manager(language: str | None, app_config: dict[str,
         typer.Exit: If a critical error occurs during translation initialization,
                     the application exits with status code 1.
     """
-    main_logger().debug("Main callback: Initializing TranslationManager...")
+    from checkconnect.config.translation_manager import TranslationManagerSingleton  # noqa: PLC0415
+
+    log = main_logger()
+    log.debug("Main callback: Initializing TranslationManager...")
     try:
         translation_manager = TranslationManagerSingleton.get_instance()
         TranslationManagerSingleton.configure_instance(
@@ -193,13 +268,13 @@ def _initialize_translation_manager(language: str | None, app_config: dict[str,
         )
 
     except Exception as e:
-        main_logger().exception("Main callback: Failed to initialize TranslationManager: ", exc_info=e)
+        log.exception("Main callback: Failed to initialize TranslationManager: ", exc_info=e)
         console.print(f"[bold red]Critical Error:[/bold red] Failed to initialize translation services: {e}")
         raise typer.Exit(1) from e
     else:
-        main_logger().info("Main callback: TranslationManager initialized.")
+        log.info("Main callback: TranslationManager initialized.")
         for err in TranslationManagerSingleton.get_initialization_errors():
-            main_logger().warning("Main callback: TranslationManager setup warning:", error_details=str(err))
+            log.warning("Main callback: TranslationManager setup warning:", error_details=str(err))
         return translation_manager
 
 
@@ -226,19 +301,22 @@ def _configure_logging_manager(*, app_context: AppContext, verbose: int, is_cli_
         typer.Exit: If a critical error occurs during logging configuration,
                     the application exits with status code 1.
     """
+    from checkconnect.config.logging_manager import VERBOSITY_LEVELS, LoggingManagerSingleton  # noqa: PLC0415
+
     main_logger().debug("Main callback: Configuring full LoggingManager via AppContext...")
 
     try:
-        # Determine cli_log_level from the verbose integer using your VERBOSITY_LEVELS
-        # The .get() with a default is good practice in case 'verbose' is out of range.
+        # Determine cli_log_level from the verbose integer using your VERBOSITY_LEVELS.
+        # A single lookup; None means 'verbose' is out of range.
         # If verbose=0 maps to WARNING and you want to show 'almost nothing',
         # that's consistent with typical logging verbosity (WARNING is less verbose than INFO/DEBUG).
-        cli_log_level = VERBOSITY_LEVELS.get(verbose, logging.WARNING)  # Fallback if verbose is out of bounds
-        if cli_log_level == logging.WARNING and verbose not in VERBOSITY_LEVELS:
+        cli_log_level = VERBOSITY_LEVELS.get(verbose)
+        if cli_log_level is None:
             main_logger().warning(
                 "Main callback: Verbose level provided by CLI is out of defined range. Defaulting CLI log level to WARNING.",
                 verbose_input=verbose,
             )
+            cli_log_level = logging.WARNING
 
         main_logger().debug(
             "Main callback: Determined CLI-Verbose and Logging Level to pass to LoggingManager.",
@@ -311,6 +389,20 @@ def main_callback(
         typer.Exit: If any critical initialization step fails, the application
                     will exit with a non-zero status code.
     """
+    # Click runs this callback before parsing the subcommand, so `<subcommand> --help`
+    # (and shell completion) would otherwise pay for the full service start-up.
+    if ctx.resilient_parsing or ctx.meta.get(_SUBCOMMAND_HELP_KEY):
+        return
+
+    # --- Phase 1: Bootstrap Logging ---
+    # Configured here rather than on import, so importing this module has no side effects
+    # and eager options like --version never pay for it. It ensures structlog is minimally
+    # configured BEFORE the managers below try to get a logger.
+    from checkconnect.config.appcontext import AppContext  # noqa: PLC0415
+    from checkconnect.config.logging_bootstrap import bootstrap_logging  # noqa: PLC0415
+
+    bootstrap_logging()
+
     main_logger().debug("Main callback: is starting!")
 
     main_logger().debug(
@@ -321,7 +413,7 @@ def main_callback(
     )
 
     # Determine execution mode (CLI vs. GUI) based on the invoked subcommand
-    is_cli_mode = ctx.invoked_subcommand in ["run", "report", "summary"]
+    is_cli_mode = ctx.invoked_subcommand in _CLI_SUBCOMMANDS
     is_gui_mode = ctx.invoked_subcommand == "gui"
 
     try:
@@ -340,21 +432,19 @@ def main_callback(
         logging_manager = _configure_logging_manager(app_context=app_context, verbose=verbose, is_cli_mode=is_cli_mode)
 
         # --- Phase 6: Store parsed option values and managers in the context object for subcommands ---
+        # ensure_object() creates ctx.obj as a dict if the caller did not pass one
         ctx.ensure_object(dict)
-        if ctx.obj is None:
-            ctx.obj = {}  # CRITICAL: Initialize ctx.obj as a dictionary if it's None
-
-        ctx.obj.update(
-            language=language,
-            verbose_mode=verbose,
-            config_file=config_file,
-            is_cli_mode=is_cli_mode,
-            is_gui_mode=is_gui_mode,
-            settings_manager=SettingsManagerSingleton.get_instance(),
-            translation_manager=TranslationManagerSingleton.get_instance(),
-            logging_manager=logging_manager,
-            app_context=app_context,
-        )
+        ctx.obj |= {
+            "language": language,
+            "verbose_mode": verbose,
+            "config_file": config_file,
+            "is_cli_mode": is_cli_mode,
+            "is_gui_mode": is_gui_mode,
+            "settings_manager": settings_manager,
+            "translation_manager": translation_manager,
+            "logging_manager": logging_manager,
+            "app_context": app_context,
+        }
 
         main_logger().debug("Main callback: All core services initialized and context prepared for subcommands.")
 
@@ -19,9 +19,7 @@ import typer
 from rich.console import Console
 
 from checkconnect.cli.options import get_data_dir_option_definition, get_report_dir_option_definition
-from checkconnect.core.checkconnect import CheckConnect
 from checkconnect.exceptions import ExitExceptionError
-from checkconnect.reports.report_generator import ReportGenerator
 from checkconnect.reports.report_manager import ReportManager
 
 if TYPE_CHECKING:
@@ -74,6 +72,10 @@ def reports(
     log.debug(app_context.gettext("Debug logging is active based on verbosity setting."))
 
     try:
+        # The PDF backend (weasyprint) and the checkers are only needed by this command
+        from checkconnect.core.checkconnect import CheckConnect  # noqa: PLC0415
+        from checkconnect.reports.report_generator import ReportGenerator  # noqa: PLC0415
+
         ntp_results: list[str] = []
         url_results: list[str] = []
 
@@ -100,8 +102,8 @@ def reports(
     except ExitExceptionError as e:
         console.print(
             app_context.gettext(
-                f"[bold red]Critical Error:[/bold red] Cannot start generate reports for checkconnect. ({e})"
-            )
+                "[bold red]Critical Error:[/bold red] Cannot start generate reports for checkconnect. ({error})"
+            ).format(error=e)
         )
         log.exception(app_context.gettext("Cannot start generate reports for checkconnect error."), exc_info=e)
         raise typer.Exit(1) from e
@@ -109,8 +111,8 @@ def reports(
     except Exception as e:
         console.print(
             app_context.gettext(
-                f"[bold red]Critical Error:[/bold red] An unexpected error occurred generate reports. ({e})"
-            )
+                "[bold red]Critical Error:[/bold red] An unexpected error occurred generate reports. ({error})"
+            ).format(error=e)
         )
         log.exception(app_context.gettext("An unexpected error occurred generate reports."), exc_info=e)
         raise typer.Exit(1) from e
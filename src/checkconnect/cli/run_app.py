@@ -15,7 +15,6 @@ import structlog
 import typer
 from rich.console import Console
 
-from checkconnect.core.checkconnect import CheckConnect
 from checkconnect.exceptions import ExitExceptionError
 
 if TYPE_CHECKING:
@@ -62,6 +61,9 @@ def run_command(ctx: typer.Context) -> None:
     log.debug(app_context.gettext("Debug logging is active based on verbosity setting."))
 
     try:
+        # The checkers pull in requests, ntplib and pydantic; load them only when checks run
+        from checkconnect.core.checkconnect import CheckConnect  # noqa: PLC0415
+
         # CheckConnect should now take the AppContext instance
         console.print(app_context.gettext("[bold green]Checking NTP and URL servers from config![/bold green]"))
 
@@ -71,14 +73,16 @@ def run_command(ctx: typer.Context) -> None:
         console.print(app_context.gettext("[bold green]All checks passed successfully![/bold green]"))
 
     except ExitExceptionError as e:
-        console.print(app_context.gettext(f"[bold red]Critical Error:[/bold red] Cannot run checks. {e}"))
+        console.print(
+            app_context.gettext("[bold red]Critical Error:[/bold red] Cannot run checks. {error}").format(error=e)
+        )
         log.exception(app_context.gettext("Cannot due checks for checkconnect."), exc_info=e)
         raise typer.Exit(1) from e
     except Exception as e:
         console.print(
             app_context.gettext(
-                f"[bold red]Critical Error:[/bold red] An unexpected error occurred during checks. ({e}"
-            )
+                "[bold red]Critical Error:[/bold red] An unexpected error occurred during checks. ({error}"
+            ).format(error=e)
         )
         console.print(str(e), style="bold red")
         log.exception(app_context.gettext("An unexpected error occurred during checks."), exc_info=e)
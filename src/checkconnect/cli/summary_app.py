@@ -113,14 +113,18 @@ def summary(
 
     except ExitExceptionError as e:
         console.print(
-            app_context.gettext(f"[bold red]Error:[/bold red] Cannot start generate summary for checkconnect. ({e})")
+            app_context.gettext(
+                "[bold red]Error:[/bold red] Cannot start generate summary for checkconnect. ({error})"
+            ).format(error=e)
         )
         log.exception(app_context.gettext("Cannot start generate summary for checkconnect."), exc_info=e)
         raise typer.Exit(1) from e
 
     except Exception as e:
         console.print(
-            app_context.gettext(f"[bold red]Error:[/bold red] An unexpected error occurred generate summary. ({e})")
+            app_context.gettext(
+                "[bold red]Error:[/bold red] An unexpected error occurred generate summary. ({error})"
+            ).format(error=e)
         )
         log.exception(app_context.gettext("An unexpected error occurred generate summary."), exc_info=e)
         raise typer.Exit(1) from e
@@ -24,12 +24,6 @@ def bootstrap_logging() -> None:
     if structlog.is_configured():
         return
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        stream=sys.stderr,
-    )
-
     pre_chain_processors = [
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
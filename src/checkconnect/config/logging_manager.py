@@ -117,9 +117,6 @@ if TYPE_CHECKING:
     from checkconnect.config.appcontext import AppContext
 
 
-# --- Global Logging Setup (Bootstrap) ---
-logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(levelname)s: %(message)s")
-
 # Console for critical errors before full logging is operational
 _error_console = Console(file=sys.stderr)  # This also fits better outside the class
 
@@ -136,6 +133,9 @@ VERBOSITY_LEVELS: dict[int, int] = {
     2: logging.DEBUG,
 }
 
+# Level numbers by upper-case name ("DEBUG", "INFO", ...), for the config's level string
+LOG_LEVELS_BY_NAME: Final[dict[str, int]] = logging.getLevelNamesMapping()
+
 
 # --- Logging Manager ---
 class LoggingManager:
@@ -352,11 +352,11 @@ class LoggingManager:
             InvalidLogLevelError: If the log level specified in the config is not valid.
         """
         settings_level_str = logger_main_settings.get("level", "INFO").upper()
-        effective_level = getattr(logging, settings_level_str, None)
+        effective_level = LOG_LEVELS_BY_NAME.get(settings_level_str)
 
-        if not isinstance(effective_level, int):
-            error_msg = self._translate_func(
-                f"Invalid log level '{settings_level_str}' in config. Falling back to INFO."
+        if effective_level is None:
+            error_msg = self._translate_func("Invalid log level '{level}' in config. Falling back to INFO.").format(
+                level=settings_level_str
             )
             self._internal_errors.append(error_msg)
             self._logger.warning(error_msg, level_from_config=settings_level_str)
@@ -715,9 +715,11 @@ class LoggingManagerSingleton:
         Returns:
             list[str]: A list of unique error messages.
         """
-        errors = list(cls._initialization_errors)
-        if cls._instance:
-            errors.extend(cls._instance.internal_errors)
+        instance_errors = cls._instance.internal_errors if cls._instance else []
+        if not cls._initialization_errors and not instance_errors:
+            return []  # Common case: nothing to copy or de-duplicate
+
+        errors = [*cls._initialization_errors, *instance_errors]
         return list(set(errors))  # Return unique errors
 
     @classmethod
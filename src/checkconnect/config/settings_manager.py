@@ -584,9 +584,11 @@ class SettingsManagerSingleton:
     @classmethod
     def get_initialization_errors(cls) -> list[str]:
         """Exposes initialization errors for testing/debugging."""
-        errors = list(cls._initialization_errors)
-        if cls._instance:
-            errors.extend(cls._instance.internal_errors)  # Now calling public method
+        instance_errors = cls._instance.internal_errors if cls._instance else []
+        if not cls._initialization_errors and not instance_errors:
+            return []  # Common case: nothing to copy or de-duplicate
+
+        errors = [*cls._initialization_errors, *instance_errors]  # Now calling public method
         return list(set(errors))  # Return unique errors
 
     @classmethod
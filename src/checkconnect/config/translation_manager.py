@@ -42,6 +42,15 @@ if TYPE_CHECKING:
 log: structlog.stdlib.BoundLogger
 log = structlog.get_logger(__name__)
 
+# Name of the directory that holds the compiled translations
+_LOCALES_DIR_NAME: Final[str] = "locales"
+
+# The locales directory next to the package sources, resolved once at import
+_SOURCE_LOCALES_DIR: Final[Path] = Path(__file__).parent.parent / _LOCALES_DIR_NAME
+
+# Environment variables checked, in order, for the system locale
+_LOCALE_ENV_VARS: Final[tuple[str, ...]] = ("LANG", "LC_ALL", "LC_CTYPE", "LANGUAGE")
+
 
 class TranslationManager:
     """
@@ -72,7 +81,7 @@ class TranslationManager:
     _translate_func: Callable[[str], str]
 
     APP_NAME: Final[str] = __app_name__.lower()
-    LOCALES_DIR_NAME: Final[str] = "locales"
+    LOCALES_DIR_NAME: Final[str] = _LOCALES_DIR_NAME
 
     def __init__(self) -> None:
         """
@@ -210,9 +219,8 @@ class TranslationManager:
             Path to the default "locales" directory inside the project.
 
         """
-        locales_dir = Path(__file__).parent.parent / self.LOCALES_DIR_NAME
-        if locales_dir.exists():
-            return locales_dir
+        if _SOURCE_LOCALES_DIR.exists():
+            return _SOURCE_LOCALES_DIR
 
         return Path(self._package_locale_dir())
 
@@ -226,17 +234,17 @@ class TranslationManager:
             self._internal_errors.append(f"Failed to resolve package locale directory for '{self.APP_NAME}': {e}")
             log.exception("Failed to resolve package locale directory", app_name=self.APP_NAME, exc_info=e)
             # Fallback for when importlib.resources.files might fail
-            return str(Path(__file__).parent.parent / self.LOCALES_DIR_NAME)
+            return str(_SOURCE_LOCALES_DIR)
         except ValueError as e:
             self._internal_errors.append(f"Failed to resolve package locale directory for '{self.APP_NAME}': {e}")
             log.exception("Failed to resolve package locale directory", app_name=self.APP_NAME, exc_info=e)
             # Fallback for when importlib.resources.files might fail
-            return str(Path(__file__).parent.parent / self.LOCALES_DIR_NAME)
+            return str(_SOURCE_LOCALES_DIR)
         except TypeError as e:
             self._internal_errors.append(f"Failed to resolve package locale directory for '{self.APP_NAME}': {e}")
             log.exception("Failed to resolve package locale directory", app_name=self.APP_NAME, exc_info=e)
             # Fallback for when importlib.resources.files might fail
-            return str(Path(__file__).parent.parent / self.LOCALES_DIR_NAME)
+            return str(_SOURCE_LOCALES_DIR)
 
     @staticmethod
     def _extract_two_letter_lang(full_locale: str) -> str:
@@ -356,7 +364,7 @@ class TranslationManager:
             A normalized full locale string (e.g., 'en_US.UTF-8') if found,
             otherwise None.
         """
-        for var in ["LANG", "LC_ALL", "LC_CTYPE", "LANGUAGE"]:
+        for var in _LOCALE_ENV_VARS:
             env_val = os.getenv(var)
             if env_val:
                 # Extract two-letter code then normalize it to a full locale string
@@ -614,9 +622,11 @@ class TranslationManagerSingleton:
     @classmethod
     def get_initialization_errors(cls) -> list[str]:
         """Exposes initialization errors for testing/debugging."""
-        errors = list(cls._initialization_errors)
-        if cls._instance:
-            errors.extend(cls._instance.internal_errors)  # Now calling public method
+        instance_errors = cls._instance.internal_errors if cls._instance else []
+        if not cls._initialization_errors and not instance_errors:
+            return []  # Common case: nothing to copy or de-duplicate
+
+        errors = [*cls._initialization_errors, *instance_errors]  # Now calling public method
         return list(set(errors))  # Return unique errors
 
     @classmethod
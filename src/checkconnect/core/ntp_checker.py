@@ -281,8 +281,8 @@ class NTPChecker:
                 difference = (ntp_time - local_time).total_seconds()
 
                 result: str = self._translate_func(
-                    f"Successfully retrieved time from {server} - Time: {time.ctime(response.tx_time)} - Difference: {difference:.2f}s",
-                )
+                    "Successfully retrieved time from {server} - Time: {time} - Difference: {difference:.2f}s",
+                ).format(server=server, time=time.ctime(response.tx_time), difference=difference)
                 self.results.append(result)
                 log.debug(
                     self._translate_func("Successfully retrieved time from server"),
@@ -293,15 +293,15 @@ class NTPChecker:
 
             except ntplib.NTPException as e:
                 error_message = self._translate_func(
-                    f"Error retrieving time from NTP server {server}: {e}",
-                )
+                    "Error retrieving time from NTP server {server}: {error}",
+                ).format(server=server, error=e)
                 self.results.append(error_message)
                 log.exception(self._translate_func("Error retrieving time from NTP server"), server=server, exc_info=e)
 
             except Exception as e:
                 error_message = self._translate_func(
-                    f"An unexpected error occurred while checking NTP server {server}: {e}"
-                )
+                    "An unexpected error occurred while checking NTP server {server}: {error}"
+                ).format(server=server, error=e)
                 self.results.append(error_message)
                 log.exception(
                     self._translate_func("An unexpected error occurred while checking NTP server"),
@@ -253,11 +253,15 @@ class URLChecker:
                     status_code=response.status_code,
                 )
                 self.results.append(
-                    self._translate_func(f"Successfully connected to {url} with Status: {response.status_code}")
+                    self._translate_func("Successfully connected to {url} with Status: {status_code}").format(
+                        url=url, status_code=response.status_code
+                    )
                 )
             except requests.RequestException as e:
                 log.exception(self._translate_func("Error by connection"), server=str(url), exc_info=e)
-                self.results.append(self._translate_func(f"Error by connection to {url}: {e}"))
+                self.results.append(
+                    self._translate_func("Error by connection to {url}: {error}").format(url=url, error=e)
+                )
             except Exception as e:  # Another specific exception should be managed.
                 log.exception(
                     self._translate_func("An unexpected error occurred while checking Web-Server"),
@@ -266,8 +270,8 @@ class URLChecker:
                 )
                 self.results.append(
                     self._translate_func(
-                        f"An unexpected error occurred while checking Web-Server: {url} with error: {e}"
-                    )
+                        "An unexpected error occurred while checking Web-Server: {url} with error: {error}"
+                    ).format(url=url, error=e)
                 )
 
         log.info(self._translate_func("All Web-Servers checked."))
@@ -273,7 +273,9 @@ class ReportGenerator:
                 self._translate_func("Failed to create report directory."), path=str(self.reports_dir), exc_info=e
             )
             # Depending on severity, you might want to raise an exception or handle gracefully
-            msg = self._translate_func(f"Failed to create report directory: '{reports_dir}': {e}")
+            msg = self._translate_func("Failed to create report directory: '{path}': {error}").format(
+                path=reports_dir, error=e
+            )
             raise DirectoryCreationError(message=msg, original_exception=e) from e
 
     # --- Factory-Methods ---
@@ -199,8 +199,8 @@ class ReportManager:
         filename = self._DATA_FILENAMES.get(data_type)
         if filename is None:
             translated_message = self._translate_func(
-                f"Unknown report data type: {data_type.value}. No filename configured."
-            )
+                "Unknown report data type: {data_type}. No filename configured."
+            ).format(data_type=data_type.value)
             raise SummaryUnknownDataError(translated_message)
 
         return self.data_dir / filename
@@ -236,7 +236,9 @@ class ReportManager:
                 path=str(output_path),
                 exc_info=e,
             )
-            translated_message = self._translate_func(f"Could not save {data_type.value} results to: {output_path}")
+            translated_message = self._translate_func("Could not save {data_type} results to: {path}").format(
+                data_type=data_type.value, path=output_path
+            )
             raise SummaryDataSaveError(message=translated_message, original_exception=e) from e
 
     def _load_json(self, data_type: ReportDataType) -> list[str]:
@@ -273,7 +275,9 @@ class ReportManager:
                 data_type_value=data_type.value,
                 path=str(file_path),
             )
-            translated_message = self._translate_func(f"Failed to load {data_type.value} results from: {file_path}")
+            translated_message = self._translate_func("Failed to load {data_type} results from: {path}").format(
+                data_type=data_type.value, path=file_path
+            )
             raise SummaryDataLoadError(message=translated_message, original_exception=e) from e
         return results
 
@@ -389,8 +393,8 @@ class ReportManager:
         """
         if summary_format not in {OutputFormat.text, OutputFormat.markdown, OutputFormat.html}:
             translated_message = self._translate_func(
-                f"Invalid format specified. Use 'text', 'markdown', or 'html' instead of {summary_format}."
-            )
+                "Invalid format specified. Use 'text', 'markdown', or 'html' instead of {summary_format}."
+            ).format(summary_format=summary_format)
             raise SummaryFormatError(message=translated_message)
 
         url_section = self._format_section(
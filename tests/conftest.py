@@ -25,9 +25,6 @@ import checkconnect.__about__ as about_module
 # Example for cli.main (e.g., if it's in checkconnect/cli/main.py)
 import checkconnect.cli.main as cli_main_module
 
-# Example for cli.options (e.g., if it's in checkconnect/cli/options.py)
-import checkconnect.cli.options as cli_options_module
-
 # Example for cli.run_app (e.g., if it's in checkconnect/cli/run_app.py)
 from checkconnect.config.appcontext import AppContext
 from checkconnect.config.logging_manager import LoggingManager, LoggingManagerSingleton
@@ -199,19 +196,9 @@ def mock_dependencies(  # noqa: PLR0915
     mocker.patch.object(about_module, "__app_org_id__", "MyAwesomeOrg")
     mocker.patch.object(about_module, "__version__", "0.1.0")
 
-    # 2. Mock Typer option definition functions (no changes here)
-    def mock_get_option_definition() -> Any:
-        import typer
-
-        return typer.Option(None)
-
-    mocker.patch.object(cli_options_module, "get_config_option_definition", return_value=mock_get_option_definition())
-    mocker.patch.object(cli_options_module, "get_language_option_definition", return_value=mock_get_option_definition())
-    mocker.patch.object(cli_options_module, "get_verbose_option_definition", return_value=mock_get_option_definition())
-    mocker.patch.object(
-        cli_options_module, "get_report_dir_option_definition", return_value=mock_get_option_definition()
-    )
-    mocker.patch.object(cli_options_module, "get_data_dir_option_definition", return_value=mock_get_option_definition())
+    # 2. The Typer option definitions are not patched: the CLI modules evaluate them from
+    # their own globals when the commands are built, so a patched definition would replace
+    # the real options of any sub-command that is first loaded during a test.
 
     # 3. Mock LoggingManagerSingleton
     mock_logging_manager_instance = MagicMock(
@@ -245,17 +232,8 @@ def mock_dependencies(  # noqa: PLR0915
     mocker.patch.object(
         LoggingManagerSingleton, "initialize_from_context", side_effect=mock_logging_initialize_from_context_side_effect
     )
-    mocker.patch.object(
-        cli_main_module.LoggingManagerSingleton,
-        "initialize_from_context",
-        side_effect=mock_logging_initialize_from_context_side_effect,
-    )
     mocker.patch.object(LoggingManagerSingleton, "get_instance", return_value=mock_logging_manager_instance)
-    mocker.patch.object(
-        cli_main_module.LoggingManagerSingleton, "get_instance", return_value=mock_logging_manager_instance
-    )
     mocker.patch.object(LoggingManagerSingleton, "get_initialization_errors", return_value=[])
-    mocker.patch.object(cli_main_module.LoggingManagerSingleton, "get_initialization_errors", return_value=[])
 
     # 4. Mock SettingsManagerSingleton
     mock_settings_instance = MagicMock(spec=SettingsManager)
@@ -304,14 +282,8 @@ def mock_dependencies(  # noqa: PLR0915
         "initialize_from_context",
         side_effect=mock_settings_singleton_initialize_from_context_side_effect,
     )
-    mocker.patch.object(
-        cli_main_module.SettingsManagerSingleton,
-        "initialize_from_context",
-        side_effect=mock_settings_singleton_initialize_from_context_side_effect,
-    )
 
     mocker.patch.object(SettingsManagerSingleton, "get_instance", return_value=mock_settings_instance)
-    mocker.patch.object(cli_main_module.SettingsManagerSingleton, "get_instance", return_value=mock_settings_instance)
     mocker.patch.object(SettingsManagerSingleton, "get_initialization_errors", return_value=[])
 
     # 5. Mock TranslationManagerSingleton
@@ -332,15 +304,7 @@ def mock_dependencies(  # noqa: PLR0915
     mocker.patch.object(
         TranslationManagerSingleton, "configure_instance", side_effect=mock_translation_configure_instance_side_effect
     )
-    mocker.patch.object(
-        cli_main_module.TranslationManagerSingleton,
-        "configure_instance",
-        side_effect=mock_translation_configure_instance_side_effect,
-    )
     mocker.patch.object(TranslationManagerSingleton, "get_instance", return_value=mock_translator_instance)
-    mocker.patch.object(
-        cli_main_module.TranslationManagerSingleton, "get_instance", return_value=mock_translator_instance
-    )
     mocker.patch.object(TranslationManagerSingleton, "get_initialization_errors", return_value=[])
 
     # 6. Mock AppContext class (Static method 'create')
@@ -747,7 +711,7 @@ def patch_checkconnect(mocker):
     """
     Patches the CheckConnect class for isolation from actual network calls.
     """
-    return mocker.patch("checkconnect.cli.run_app.CheckConnect")
+    return mocker.patch("checkconnect.core.checkconnect.CheckConnect")
 
 
 # You can also use Pytest's built-in `tmp_path` fixture for general temporary paths if preferred.
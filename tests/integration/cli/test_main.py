@@ -12,12 +12,17 @@ and proper command dispatch.
 from __future__ import annotations
 
 import logging
+import os
+import subprocess
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+import typer.main
 
+from checkconnect.cli import main as cli_main
 from checkconnect.cli.main import main_app
 from checkconnect.config.appcontext import AppContext
 from tests.utils.common import assert_common_cli_logs, clean_cli_output
@@ -35,7 +40,7 @@ def mock_checkconnect_class(mocker: MockerFixture):
 
     This version correctly mocks properties using PropertyMock.
     """
-    with patch("checkconnect.cli.run_app.CheckConnect") as mock_cc_class:
+    with patch("checkconnect.core.checkconnect.CheckConnect") as mock_cc_class:
         # Create a mock instance of the CheckConnect class.
         mock_instance = MagicMock(name="CheckConnect_instance")
         mock_instance.run_all_checks.return_value = None
@@ -588,5 +593,95 @@ class TestCliMain:
         assert "version" in cleaned.lower()
 
 
+# Runs in a fresh interpreter, since conftest imports the sub-command modules up front.
+# Prints the sub-command modules that were loaded for the given arguments.
+_LOADED_SUBCOMMANDS_SCRIPT = """
+import sys
+
+import typer.main
+
+from checkconnect.cli.main import main_app
+
+args = sys.argv[1:]
+group = typer.main.get_command(main_app)
+if args[0] == "--resolve":
+    # Resolve the sub-command the way Click does right before dispatching to it.
+    ctx = group.make_context("cli", args[1:])
+    group.resolve_command(ctx, args[1:])
+else:
+    try:
+        group.main(args, prog_name="cli", standalone_mode=False)
+    except SystemExit:
+        pass
+print("loaded:", ",".join(sorted(name for name in sys.modules if name.startswith("checkconnect.cli.") and name.endswith("_app"))))
+"""
+
+
+class TestCliLazySubcommands:
+    @staticmethod
+    def _loaded_subcommand_modules(*args: str) -> list[str]:
+        result = subprocess.run(
+            [sys.executable, "-c", _LOADED_SUBCOMMANDS_SCRIPT, *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "NO_COLOR": "1", "TERM": "dumb"},
+        )
+        loaded = result.stdout.rpartition("loaded:")[2].strip()
+        return [name for name in loaded.split(",") if name]
+
+    @pytest.mark.integration
+    def test_run_imports_only_run_app(self) -> None:
+        """Ensure dispatching to 'run' loads the run sub-command module and no other."""
+        assert self._loaded_subcommand_modules("--resolve", "run") == ["checkconnect.cli.run_app"]
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("option", ["--help", "--version"])
+    def test_root_options_import_no_subcommand(self, option: str) -> None:
+        """Ensure the root '--help' and '--version' do not load any sub-command module."""
+        assert self._loaded_subcommand_modules(option) == []
+
+    @pytest.mark.parametrize("name", ["run", "report", "summary", "gui"])
+    def test_subcommand_summaries_match_docstrings(self, name: str) -> None:
+        """Ensure the root help lists the same description as the sub-command's own docstring."""
+        group = typer.main.get_command(main_app)
+        command = group.get_command(group.make_context("cli", []), name)
+
+        assert command is not None
+        assert command.help is not None
+        assert command.help.splitlines()[0] == cli_main._SUBCOMMAND_SUMMARIES[name]  # noqa: SLF001
+
+    @pytest.mark.integration
+    def test_subcommand_help_matches_root_app(self, runner: CliRunner) -> None:
+        """Ensure a sub-command's help has no completion options and keeps its docstring layout."""
+        result = runner.invoke(main_app, ["run", "--help"], env={"NO_COLOR": "1", "TERM": "dumb"})
+
+        assert result.exit_code == 0, result.output
+        assert "--install-completion" not in result.output
+        assert "--show-completion" not in result.output
+        # With the root app's rich markup mode, the docstring sections stay on their own lines.
+        lines = [line.strip() for line in result.output.splitlines()]
+        assert "Args:" in lines
+        assert "Raises:" in lines
+
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["run", "--help"], True),
+            (["report", "-r", "reports", "--help"], True),
+            (["run", "--", "--help"], False),
+            (["report", "--reports-dir", "--help"], False),
+            (["run"], False),
+        ],
+    )
+    def test_subcommand_help_detection(self, args: list[str], *, expected: bool) -> None:
+        """Ensure only a real help flag of the sub-command skips the service start-up."""
+        group = typer.main.get_command(main_app)
+        ctx = group.make_context("cli", list(args))
+        group.resolve_command(ctx, list(args))
+
+        assert ctx.meta[cli_main._SUBCOMMAND_HELP_KEY] is expected  # noqa: SLF001
+
+
 if __name__ == "__main__":
     main_app()
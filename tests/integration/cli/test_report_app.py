@@ -49,7 +49,7 @@ def mock_report_manager_class():
 @pytest.fixture
 def mock_report_generator_class():
     """Mocks the ReportGenerator class and its instance methods."""
-    with patch("checkconnect.cli.report_app.ReportGenerator") as mock_rg_class:
+    with patch("checkconnect.reports.report_generator.ReportGenerator") as mock_rg_class:
         mock_instance = MagicMock(name="ReportGenerator_instance")
         mock_instance.generate_reports.return_value = None
         mock_rg_class.from_params.return_value = mock_instance
@@ -63,7 +63,7 @@ def mock_checkconnect_class(mocker: MockerFixture):
 
     This version correctly mocks properties using PropertyMock.
     """
-    with patch("checkconnect.cli.report_app.CheckConnect") as mock_cc_class:
+    with patch("checkconnect.core.checkconnect.CheckConnect") as mock_cc_class:
         # Create a mock instance of the CheckConnect class.
         mock_instance = MagicMock(name="CheckConnect_instance")
         mock_instance.run_all_checks.return_value = None
@@ -680,9 +680,6 @@ class TestCliReports:
         Test that 'run summary --help' displays the help message specific to the 'run' command.
         """
         # Arrange
-        settings_manager_instance = mock_dependencies["settings_manager_instance"]
-        logging_manager_instance = mock_dependencies["logging_manager_instance"]
-        translation_manager_instance = mock_dependencies["translation_manager_instance"]
         app_context_instance = mock_dependencies["app_context_instance"]
 
         # Ensure AppContext.create.return_value is readily available for later assertions
@@ -704,14 +701,8 @@ class TestCliReports:
         # Assert
         assert result.exit_code == 0, f"Unexpected failure: {result.exception}"
 
-        # Common initialization assertions
-        assert_common_initialization(
-            settings_manager_instance=settings_manager_instance,
-            logging_manager_instance=logging_manager_instance,
-            translation_manager_instance=translation_manager_instance,
-            expected_cli_log_level=logging.WARNING,  # Default from verbose=0 in cli_main
-            expected_language="en",
-        )
+        # Help for a subcommand is shown without starting the application services
+        AppContext.create.assert_not_called()
 
         # Headers
         assert "Usage: cli report [OPTIONS]" in cleaned
@@ -729,44 +720,7 @@ class TestCliReports:
         )
 
         # --- Asserting on Specific Log Entries from Your Output ---
-
-        # 1. Assert initial CLI startup (DEBUG)
-        assert any(
-            e.get("event") == "Main callback: is starting!" and e.get("log_level") == "debug" for e in caplog_structlog
-        )
-        assert any(
-            e.get("event") == "CLI Args"
-            and e.get("log_level") == "debug"
-            and e.get("verbose") == 0
-            and e.get("language") is None
-            and e.get("config_file") is None
-            for e in caplog_structlog
-        )
-
-        # 2. Assert key INFO level success messages
-        assert any(
-            e.get("event") == "Main callback: SettingsManager initialized and configuration loaded."
-            and e.get("log_level") == "info"
-            for e in caplog_structlog
-        )
-        assert any(
-            e.get("event") == "Main callback: TranslationManager initialized." and e.get("log_level") == "info"
-            for e in caplog_structlog
-        )
-        assert any(
-            e.get("event") == "Main callback: Full logging configured based on application settings and CLI options."
-            and e.get("log_level") == "info"
-            for e in caplog_structlog
-        )
-
-        # 3. Assert CLI-Verbose and Logging Level determination (DEBUG)
-        assert any(
-            e.get("event") == "Main callback: Determined CLI-Verbose and Logging Level to pass to LoggingManager."
-            and e.get("log_level") == "debug"
-            and e.get("verbose_input") == 0
-            and e.get("derived_cli_log_level") == "WARNING"
-            for e in caplog_structlog
-        )
+        assert not any(e.get("event") == "Main callback: is starting!" for e in caplog_structlog)
 
         # At the end of the assert block for successful tests:
         assert not any(e.get("log_level") == "error" or e.get("log_level") == "critical" for e in caplog_structlog), (
@@ -43,7 +43,7 @@ def mock_checkconnect_class(mocker: MockerFixture):
 
     This version correctly mocks properties using PropertyMock.
     """
-    with patch("checkconnect.cli.report_app.CheckConnect") as mock_cc_class:
+    with patch("checkconnect.core.checkconnect.CheckConnect") as mock_cc_class:
         # Create a mock instance of the CheckConnect class.
         mock_instance = MagicMock(name="CheckConnect_instance")
         mock_instance.run_all_checks.return_value = None
@@ -569,6 +569,9 @@ class TestCliSummary:
         # Assert
         assert result.exit_code == 0, f"Unexpected failure: {result.exception}"
 
+        # Help for a subcommand is shown without starting the application services
+        AppContext.create.assert_not_called()
+
         # Headers
         assert "Usage: cli summary [OPTIONS]" in cleaned
         assert "Generate a summary of the most recent connectivity test results." in cleaned
@@ -585,44 +588,7 @@ class TestCliSummary:
         )
 
         # --- Asserting on Specific Log Entries from Your Output ---
-
-        # 1. Assert initial CLI startup (DEBUG)
-        assert any(
-            e.get("event") == "Main callback: is starting!" and e.get("log_level") == "debug" for e in caplog_structlog
-        )
-        assert any(
-            e.get("event") == "CLI Args"
-            and e.get("log_level") == "debug"
-            and e.get("verbose") == 0
-            and e.get("language") is None
-            and e.get("config_file") is None
-            for e in caplog_structlog
-        )
-
-        # 2. Assert key INFO level success messages
-        assert any(
-            e.get("event") == "Main callback: SettingsManager initialized and configuration loaded."
-            and e.get("log_level") == "info"
-            for e in caplog_structlog
-        )
-        assert any(
-            e.get("event") == "Main callback: TranslationManager initialized." and e.get("log_level") == "info"
-            for e in caplog_structlog
-        )
-        assert any(
-            e.get("event") == "Main callback: Full logging configured based on application settings and CLI options."
-            and e.get("log_level") == "info"
-            for e in caplog_structlog
-        )
-
-        # 3. Assert CLI-Verbose and Logging Level determination (DEBUG)
-        assert any(
-            e.get("event") == "Main callback: Determined CLI-Verbose and Logging Level to pass to LoggingManager."
-            and e.get("log_level") == "debug"
-            and e.get("verbose_input") == 0
-            and e.get("derived_cli_log_level") == "WARNING"
-            for e in caplog_structlog
-        )
+        assert not any(e.get("event") == "Main callback: is starting!" for e in caplog_structlog)
 
         # At the end of the assert block for successful tests:
         assert not any(e.get("log_level") == "error" or e.get("log_level") == "critical" for e in caplog_structlog), (